@@ -85,3 +85,23 @@ def test_failed_transfer():
     )
 
     assert result
+
+
+def test_directory_transfer_is_single_recursive_item(tmp_path):
+    (tmp_path / "scan" / "sub").mkdir(parents=True)
+    (tmp_path / "scan" / "a.h5").write_text("a")
+    (tmp_path / "scan" / "sub" / "b.h5").write_text("b")
+    transfer_client = MockTransferClient()
+    source_endpoint = GlobusEndpoint("123", "source.magrathea.com", "/root")
+    dest_endpoint = GlobusEndpoint("456", "dest.magrathea.com", "/root")
+
+    result = start_transfer(
+        transfer_client, source_endpoint, str(tmp_path / "scan"), dest_endpoint, "/42"
+    )
+
+    assert result
+    items = transfer_client.transfer_data["DATA"]
+    assert len(items) == 1
+    assert items[0]["recursive"] is True
+    assert items[0]["source_path"] == str(tmp_path / "scan")
+    assert items[0]["destination_path"] == "/42/scan"
@@ -1,4 +1,8 @@
 import asyncio
+import datetime
+from concurrent.futures import Future
+import threading
+import time
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 import warnings
@@ -389,3 +393,73 @@ def test_process_new_832_ALCF_flow(mocker: MockFixture):
     mock_alcf_tiff_to_zarr_flow.reset_mock()
     mock_transfer_to_data832.reset_mock()
     mock_schedule_pruning.reset_mock()
+
+
+def test_wait_for_globus_compute_future_returns_when_done(mocker: MockFixture):
+    mock_secret = mocker.MagicMock()
+    mock_secret.value = str(uuid4())
+    with mocker.patch('prefect.blocks.system.Secret.load', return_value=mock_secret):
+        from orchestration.flows.bl832.alcf import wait_for_globus_compute_future
+
+    mocker.patch('orchestration.flows.bl832.alcf.get_run_logger', return_value=mocker.MagicMock())
+
+    future = Future()
+    threading.Timer(0.1, future.set_result, args=("done",)).start()
+
+    start = time.time()
+    result = wait_for_globus_compute_future.fn(future, "test", check_interval=30)
+
+    assert result is True
+    assert time.time() - start < 5, "Should not sleep out the full check interval"
+
+
+def test_schedule_many_looks_up_each_deployment_once(mocker: MockFixture):
+    """schedule_many should share one deployment lookup per name and report failures per schedule."""
+    from orchestration.prefect import _deployment_cache, schedule_many
+
+    _deployment_cache.clear()
+
+    mock_read = mocker.patch('prefect.client.orchestration.PrefectClient.read_deployment_by_name',
+                             new=mocker.AsyncMock(return_value=mocker.MagicMock(id=uuid4())))
+    mock_create = mocker.patch('prefect.client.orchestration.PrefectClient.create_flow_run_from_deployment',
+                               new=mocker.AsyncMock(side_effect=[None, RuntimeError("boom"), None]))
+
+    delay = datetime.timedelta(days=1)
+    results = asyncio.run(schedule_many([
+        ("prune_data832_raw/prune_data832_raw", "delete a", {"relative_path": "a"}, delay),
+        ("prune_data832_raw/prune_data832_raw", "delete b", {"relative_path": "b"}, delay),
+        ("prune_alcf832_raw/prune_alcf832_raw", "delete c", {"relative_path": "c"}, delay),
+    ]))
+
+    assert mock_read.await_count == 2
+    assert mock_create.await_count == 3
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_globus_settings_cached_until_invalidated(mocker: MockFixture):
+    """The globus-settings block should be loaded once per TTL, and again after invalidation."""
+    from orchestration.flows.bl832 import prune
+
+    mock_load = mocker.patch('orchestration.flows.bl832.prune.JSON.load',
+                             return_value=mocker.MagicMock(value={"max_wait_seconds": 600}))
+    prune.invalidate_globus_settings()
+
+    assert prune.get_globus_settings() == {"max_wait_seconds": 600}
+    assert prune.get_globus_settings() == {"max_wait_seconds": 600}
+    assert mock_load.call_count == 1
+
+    prune.invalidate_globus_settings()
+    prune.get_globus_settings()
+    assert mock_load.call_count == 2
+
+
+def test_prune_flows_named_after_module_attributes():
+    """Default deployment entrypoints use flow.fn.__name__, so it must match the module attribute."""
+    from orchestration.flows.bl832 import prune
+
+    for location in ["spot832", "data832", "data832_raw", "data832_scratch",
+                     "alcf832_raw", "alcf832_scratch", "nersc832_alsdev_scratch"]:
+        prune_flow = getattr(prune, f"prune_{location}")
+        assert prune_flow.name == f"prune_{location}"
+        assert prune_flow.fn.__name__ == f"prune_{location}"
@@ -0,0 +1,57 @@
+import logging
+
+import pytest
+from sfapi_client import SfApiError
+from sfapi_client.jobs import JobState
+
+from orchestration.nersc import NerscClient
+
+
+def test_task_wait_polls_until_job_is_visible(mocker):
+    # Skip __init__, which authenticates against the SFAPI
+    client = NerscClient.__new__(NerscClient)
+    client.logger = logging.getLogger(__name__)
+    client.jobid = "12345"
+    client.job = None
+    client.job_state = None
+    client.has_ran = False
+    client.perlmutter = mocker.MagicMock()
+    client.perlmutter.job.side_effect = [
+        SfApiError("Job not found: 12345"),
+        mocker.MagicMock(state=JobState.COMPLETED),
+    ]
+    mocker.patch("orchestration.nersc.time.sleep")
+
+    assert client.task_wait(timeout=60) is True
+    assert client.perlmutter.job.call_count == 2
+
+
+def test_task_wait_raises_other_sfapi_errors(mocker):
+    client = NerscClient.__new__(NerscClient)
+    client.logger = logging.getLogger(__name__)
+    client.jobid = "12345"
+    client.job_state = None
+    client.perlmutter = mocker.MagicMock()
+    client.perlmutter.job.side_effect = SfApiError("Unauthorized")
+    mocker.patch("orchestration.nersc.time.sleep")
+
+    with pytest.raises(SfApiError):
+        client.task_wait(timeout=60)
+
+
+def test_task_wait_gives_up_on_job_that_never_appears(mocker):
+    client = NerscClient.__new__(NerscClient)
+    client.logger = logging.getLogger(__name__)
+    client.jobid = "12345"
+    client.job_state = None
+    client.perlmutter = mocker.MagicMock()
+    client.perlmutter.job.side_effect = SfApiError("Job not found: 12345")
+
+    # fake clock that advances by however long task_wait sleeps
+    clock = [0.0]
+    mocker.patch("orchestration.nersc.time.time", side_effect=lambda: clock[0])
+    mocker.patch("orchestration.nersc.time.sleep", side_effect=lambda s: clock.__setitem__(0, clock[0] + s))
+
+    with pytest.raises(SfApiError):
+        client.task_wait(not_found_grace=300)
+    assert 300 < clock[0] < 400
@@ -2,7 +2,9 @@ import h5py
 import json
 import numpy as np
 import pytest
+import sys
 
+from orchestration.flows.bl832.ingest_tomo832 import clean_email, UNKNWON_EMAIL
 from orchestration.flows.scicat.utils import NPArrayEncoder
 
 from orchestration.flows.scicat.utils import (
@@ -90,4 +92,72 @@ def test_access_controls():
     access_controls = calculate_access_controls(username, "bl832", "42")
     assert access_controls["owner_group"] == "42"
     assert "8.3.2" in access_controls["access_groups"]
-    assert "bl832" in access_controls["access_groups"]
\ No newline at end of file
+    assert "bl832" in access_controls["access_groups"]
+
+
+def test_clean_email():
+    assert clean_email(" 'arthur@dent.com', ") == "arthur@dent.com"
+    assert clean_email("None") == UNKNWON_EMAIL
+    assert clean_email(None) is None
+
+
+def test_get_scicat_client_reuses_login(mocker):
+    from orchestration.flows.scicat import ingest
+
+    ingest._scicat_clients.clear()
+    mock_from_credentials = mocker.patch("orchestration.flows.scicat.ingest.from_credentials",
+                                         side_effect=lambda *args: mocker.MagicMock())
+
+    client = ingest.get_scicat_client("http://localhost:3000/api/v3", "user", "password")
+    assert ingest.get_scicat_client("http://localhost:3000/api/v3", "user", "password") is client
+    assert mock_from_credentials.call_count == 1
+
+    # an expired entry logs in again
+    assert ingest.get_scicat_client("http://localhost:3000/api/v3", "user", "password", ttl=0) is not client
+    assert mock_from_credentials.call_count == 2
+
+
+def test_ingest_comm_error_drops_cached_client(mocker, monkeypatch):
+    from pyscicat.client import ScicatCommError
+    from orchestration.flows.scicat import ingest
+
+    ingest._scicat_clients.clear()
+    monkeypatch.setenv("SCICAT_API_URL", "http://localhost:3000/api/v3")
+    monkeypatch.setenv("SCICAT_INGEST_USER", "user")
+    monkeypatch.setenv("SCICAT_INGEST_PASSWORD", "password")
+    mocker.patch("orchestration.flows.scicat.ingest.get_run_logger")
+    mock_from_credentials = mocker.patch("orchestration.flows.scicat.ingest.from_credentials",
+                                         side_effect=lambda *args: mocker.MagicMock())
+    ingestor = mocker.MagicMock()
+    ingestor.ingest.side_effect = [ScicatCommError("Error in operation : 401"), "dataset_id"]
+    monkeypatch.setitem(sys.modules, "foo_ingestor", ingestor)
+
+    with pytest.raises(ScicatCommError):
+        ingest.ingest_dataset_task.fn("/raw/test.h5", "foo_ingestor")
+    assert ingest._scicat_clients == {}
+
+    assert ingest.ingest_dataset_task.fn("/raw/test.h5", "foo_ingestor") == "dataset_id"
+    assert mock_from_credentials.call_count == 2
+
+
+def test_ingest_datasets_logs_in_once(mocker, monkeypatch):
+    from prefect.testing.utilities import prefect_test_harness
+    from orchestration.flows.scicat import ingest
+
+    ingest._scicat_clients.clear()
+    monkeypatch.setenv("SCICAT_API_URL", "http://localhost:3000/api/v3")
+    monkeypatch.setenv("SCICAT_INGEST_USER", "user")
+    monkeypatch.setenv("SCICAT_INGEST_PASSWORD", "password")
+    mock_from_credentials = mocker.patch("orchestration.flows.scicat.ingest.from_credentials",
+                                         return_value=mocker.MagicMock())
+    ingestor = mocker.MagicMock()
+    ingestor.ingest.side_effect = lambda client, file_path, issues: f"id:{file_path}"
+    monkeypatch.setitem(sys.modules, "foo_ingestor", ingestor)
+
+    file_paths = ["/raw/a.h5", "/raw/b.h5", "/raw/c.h5"]
+    with prefect_test_harness():
+        result = ingest.ingest_datasets(file_paths, "foo_ingestor")
+
+    assert result == ["id:/raw/a.h5", "id:/raw/b.h5", "id:/raw/c.h5"]
+    assert mock_from_credentials.call_count == 1
+    assert [c.args[1] for c in ingestor.ingest.call_args_list] == file_paths
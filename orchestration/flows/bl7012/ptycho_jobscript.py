@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 from collections import OrderedDict
+from string import Template
 
 cdtools_parms = OrderedDict(
     {
@@ -29,26 +30,37 @@ ptychocam_parms = OrderedDict(
 )
 
 
-def create_job_script(path_job_script, n_gpu, args, time=4, nodes=1):
+job_script_template = Template(
+    """#!/bin/bash
+#SBATCH --constraint=gpu
+#SBATCH --gpus=${n_gpu}
+#SBATCH --time=${time}:00:00
+#SBATCH --nodes=${nodes}
+#SBATCH --qos=regular
+#SBATCH --account=als_g
+${args}"""
+)
+
+
+def render_job_script(n_gpu, args, time=4, nodes=1):
+    return job_script_template.substitute(
+        n_gpu=int(n_gpu), time=str(time).zfill(2), nodes=int(nodes), args=args
+    )
+
+
+def write_job_script(path_job_script, job_string):
     now = datetime.now()
     time_str = now.strftime("%Y-%m-%d %H:%M:%S")
     jobpath = os.path.join(path_job_script, "%s.txt" % time_str)
     with open(jobpath, "w") as f:
-        f.write("#!/bin/bash\n")
-        f.write("#SBATCH --constraint=gpu\n")
-        f.write("#SBATCH --gpus=%d\n" % n_gpu)
-        f.write("#SBATCH --time=%s:00:00\n" % (str(time).zfill(2)))
-        f.write("#SBATCH --nodes=%d\n" % nodes)
-        f.write("#SBATCH --qos=regular\n")
-        f.write("#SBATCH --account=als_g\n")
-        f.write("%s" % (args))
+        f.write(job_string)
     return jobpath
 
 
 def get_job_script(path_job_script, n_gpu, args):
-    job_path = create_job_script(path_job_script, n_gpu, args)
-    with open(job_path, "r") as f:
-        job_string = f.read()
+    # keep a copy of the submitted script on disk, but don't read it back
+    job_string = render_job_script(n_gpu, args)
+    write_job_script(path_job_script, job_string)
     return job_string
 
 
@@ -22,10 +22,7 @@ class NerscPtychoClient(NerscClient):
             cxiname, path_cdtools_nersc, cdtools_parms, **kwargs
         )
         job_script = get_job_script(path_job_script, n_gpu, args_string)
-        self.logger.info(f"Job script: {job_script}")
-
-        self.submit_job(job_script)
-        self.task_wait()
+        return self._submit_and_wait(job_script)
 
     def ptychocam(
         self, cxiname, path_job_script, path_ptychocam_nersc, n_gpu, **kwargs
@@ -34,8 +31,10 @@ class NerscPtychoClient(NerscClient):
             cxiname, path_ptychocam_nersc, ptychocam_parms, **kwargs
         )
         job_script = get_job_script(path_job_script, n_gpu, args_string)
+        return self._submit_and_wait(job_script)
 
+    def _submit_and_wait(self, job_script):
         self.logger.info(f"Job script: {job_script}")
 
         self.submit_job(job_script)
-        self.task_wait()
+        return self.task_wait()
@@ -1,4 +1,4 @@
-from concurrent.futures import Future
+from concurrent.futures import Future, wait
 import datetime
 import os
 from pathlib import Path
@@ -13,7 +13,7 @@ from prefect.blocks.system import JSON, Secret
 
 from orchestration.flows.bl832.config import Config832
 from orchestration.globus.transfer import GlobusEndpoint, start_transfer
-from orchestration.prefect import schedule_prefect_flow
+from orchestration.prefect import schedule_prefect_flows
 
 
 @task(name="transfer_data_to_alcf")
@@ -122,41 +122,6 @@ def transfer_data_to_data832(
         logger.info(f"Transfer process took {elapsed_time:.2f} seconds.")
 
 
-@task(name="schedule_prune_task")
-def schedule_prune_task(
-    path: str,
-    location: str,
-    schedule_days: datetime.timedelta,
-    source_endpoint=None,
-    check_endpoint=None
-) -> bool:
-    """
-    Schedules a Prefect flow to prune files from a specified location.
-
-    Args:
-        path (str): The file path to the folder containing the files.
-        location (str): The server location (e.g., 'alcf832_raw') where the files will be pruned.
-        schedule_days (int): The number of days after which the file should be deleted.
-    """
-    try:
-        flow_name = f"delete {location}: {Path(path).name}"
-        schedule_prefect_flow(
-            deployment_name=f"prune_{location}/prune_{location}",
-            flow_run_name=flow_name,
-            parameters={
-                "relative_path": path,
-                "source_endpoint": source_endpoint,
-                "check_endpoint": check_endpoint
-            },
-            duration_from_now=schedule_days
-        )
-        return True
-    except Exception as e:
-        logger = get_run_logger()
-        logger.error(f"Failed to schedule prune task: {e}")
-        return False
-
-
 @task(name="schedule_pruning")
 def schedule_pruning(
     alcf_raw_path: str = None,
@@ -207,13 +172,31 @@ def schedule_pruning(
         (data832_scratch_path_zarr, "data832_scratch", data832_delay, config.data832_scratch, None)
     ]
 
+    # Collect all prune runs and schedule them in one batch instead of one round trip each
+    prune_schedules = []
     for path, location, days, source_endpoint, check_endpoint in delete_schedules:
         if path:
-            schedule_prune_task(path, location, days, source_endpoint, check_endpoint)
-            logger.info(f"Scheduled delete from {location} at {days} days")
+            prune_schedules.append((
+                f"prune_{location}/prune_{location}",
+                f"delete {location}: {Path(path).name}",
+                {
+                    "relative_path": path,
+                    "source_endpoint": source_endpoint,
+                    "check_endpoint": check_endpoint
+                },
+                days
+            ))
         else:
             logger.info(f"Path not provided for {location}, skipping scheduling of deletion task.")
 
+    if prune_schedules:
+        results = schedule_prefect_flows(prune_schedules)
+        for (deployment_name, _, _, days), result in zip(prune_schedules, results):
+            if result is None:
+                logger.info(f"Scheduled {deployment_name} at {days} days")
+            else:
+                logger.error(f"Failed to schedule prune task {deployment_name}: {result}")
+
     return True
 
 
@@ -250,7 +233,8 @@ def wait_for_globus_compute_future(
                 logger.info(f"The {task_name} task is running...")
                 previous_state = 'running'
 
-            time.sleep(check_interval)  # Wait before the next status check
+            # Wake up as soon as the future resolves rather than sleeping out the interval
+            wait([future], timeout=check_interval)
 
         # Task is done, check if it was cancelled or raised an exception
         if future.cancelled():
@@ -332,8 +316,9 @@ def reconstruction_wrapper(
     os.chdir(rundir)
 
     # Run reconstruction.py
-    command = f"python {script_path} {h5_file_name} {folder_path}"
-    recon_res = subprocess.run(command.split(" "), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # Pass arguments as a list so paths with spaces or shell characters stay single tokens
+    command = ["python", script_path, h5_file_name, folder_path]
+    recon_res = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
     rec_end = time.time()
 
@@ -406,8 +391,8 @@ def tiff_to_zarr_wrapper(
     os.chdir(rundir)
 
     # Convert tiff files to zarr
-    command = (f"python {script_path} {recon_path} --raw_directory {raw_path}")
-    zarr_res = subprocess.run(command.split(" "), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    command = ["python", script_path, recon_path, "--raw_directory", raw_path]
+    zarr_res = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
     return (
         f"Converted tiff files to zarr;\n {zarr_res}"
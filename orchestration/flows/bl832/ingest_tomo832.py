@@ -3,7 +3,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import h5py
 from pyscicat.client import ScicatClient
@@ -30,6 +30,8 @@ from orchestration.flows.scicat.utils import (
 DEFAULT_USER = "8.3.2" # In case there's not proposal number
 UNKNWON_EMAIL = "unknown@example.com"
 ingest_spec = "als832_dx_3"
+# characters the beamline sometimes leaves in email fields
+EMAIL_STRIP_TABLE = str.maketrans("", "", " ,'")
 
 logger = logging.getLogger("scicat_ingest")
 
@@ -72,6 +74,7 @@ def ingest(
 
     with h5py.File(file_path, "r") as file:
         file_path = Path(file_path)
+        file_size, file_mod_time = get_file_size_and_mod_time(file_path)
         scicat_metadata = _extract_fields(file, scicat_metadata_keys, issues)
         scientific_metadata = _extract_fields(file, scientific_metadata_keys, issues)
         scientific_metadata["data_sample"] = _get_data_sample(file)
@@ -98,13 +101,17 @@ def ingest(
             scicat_metadata,
             encoded_scientific_metadata,
             ownable,
+            file_size,
+            file_mod_time,
         )
         upload_data_block(
             scicat_client,
             file_path,
-            dataset_id, 
+            dataset_id,
             INGEST_STORAGE_ROOT_PATH,
-            INGEST_SOURCE_ROOT_PATH)
+            INGEST_SOURCE_ROOT_PATH,
+            file_size,
+            file_mod_time)
 
         thumbnail_file = build_thumbnail(file["/exchange/data"][0])
         encoded_thumbnail = encode_image_2_thumbnail(thumbnail_file)
@@ -123,10 +130,10 @@ def upload_raw_dataset(
     scicat_metadata: Dict,
     scientific_metadata: Dict,
     ownable: Ownable,
+    file_size: int,
+    file_mod_time: str,
 ) -> str:
     "Creates a dataset object"
-    file_size = get_file_size(file_path)
-    file_mod_time = get_file_mod_time(file_path)
     file_name = scicat_metadata.get("/measurement/sample/file_name")
     description = build_search_terms(file_name)
     appended_keywords = description.split()
@@ -160,13 +167,13 @@ def upload_raw_dataset(
     return dataset_id
 
 
-def create_data_files(file_path: Path, storage_path: str) -> List[DataFile]:
+def create_data_files(storage_path: str, file_size: int, file_mod_time: str) -> List[DataFile]:
     "Collects all fits files"
     datafiles = []
     datafile = DataFile(
         path=storage_path,
-        size=get_file_size(file_path),
-        time=get_file_mod_time(file_path),
+        size=file_size,
+        time=file_mod_time,
         type="RawDatasets",
     )
     datafiles.append(datafile)
@@ -178,15 +185,17 @@ def upload_data_block(
     file_path: Path,
     dataset_id: str,
     storage_root_path: str,
-    source_root_path: str
+    source_root_path: str,
+    file_size: int,
+    file_mod_time: str,
 ) -> Datablock:
     "Creates a datablock of files"
     # calcularte the path where the file will as known to SciCat
     storage_path = str(file_path).replace(source_root_path, storage_root_path)
-    datafiles = create_data_files(file_path, storage_path)
+    datafiles = create_data_files(storage_path, file_size, file_mod_time)
 
     datablock = CreateDatasetOrigDatablockDto(
-        size=get_file_size(file_path),
+        size=file_size,
         dataFileList=datafiles
     )
     return scicat_client.upload_dataset_origdatablock(dataset_id, datablock)
@@ -209,12 +218,10 @@ def upload_attachment(
     scicat_client.upload_attachment(attachment)
 
 
-def get_file_size(file_path: Path) -> int:
-    return file_path.lstat().st_size
-
-
-def get_file_mod_time(file_path: Path) -> str:
-    return datetime.fromtimestamp(file_path.lstat().st_mtime).isoformat()
+def get_file_size_and_mod_time(file_path: Path) -> Tuple[int, str]:
+    # one lstat serves both the dataset and the datablock
+    file_stat = file_path.lstat()
+    return file_stat.st_size, datetime.fromtimestamp(file_stat.st_mtime).isoformat()
 
 
 def _extract_fields(file, keys, issues) -> Dict[str, Any]:
@@ -273,7 +280,7 @@ def clean_email(email: str):
             # this is a brutal case, but the beamline sometimes puts in "None" and
             # the new scicat backend hates that.
             return UNKNWON_EMAIL
-        return email.replace(" ", "").replace(",", "").replace("'", "")
+        return email.translate(EMAIL_STRIP_TABLE)
     return None
 
 
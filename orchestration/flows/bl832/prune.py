@@ -1,4 +1,5 @@
 import logging
+import time
 from prefect import flow, get_run_logger
 from prefect.blocks.system import JSON
 from typing import Union
@@ -9,6 +10,22 @@ from orchestration.globus.transfer import GlobusEndpoint, prune_one_safe
 
 logger = logging.getLogger(__name__)
 
+GLOBUS_SETTINGS_TTL_SECONDS = 300
+# (loaded_at, value) of the "globus-settings" block, shared by prune runs in this process
+_globus_settings_cache = None
+
+
+def get_globus_settings(ttl=GLOBUS_SETTINGS_TTL_SECONDS):
+    global _globus_settings_cache
+    if _globus_settings_cache is None or time.monotonic() - _globus_settings_cache[0] >= ttl:
+        _globus_settings_cache = (time.monotonic(), JSON.load("globus-settings").value)
+    return _globus_settings_cache[1]
+
+
+def invalidate_globus_settings():
+    global _globus_settings_cache
+    _globus_settings_cache = None
+
 
 def prune_files(
     relative_path: str,
@@ -28,7 +45,7 @@ def prune_files(
     if config is None:
         config = Config832()
 
-    globus_settings = JSON.load("globus-settings").value
+    globus_settings = get_globus_settings()
     max_wait_seconds = globus_settings["max_wait_seconds"]
     flow_name = f"prune_from_{source_endpoint.name}"
     p_logger.info(f"Running flow: {flow_name}")
@@ -44,103 +61,39 @@ def prune_files(
     )
 
 
-@flow(name="prune_spot832")
-def prune_spot832(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config
-    )
-
-
-@flow(name="prune_data832")
-def prune_data832(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config)
-
-
-@flow(name="prune_data832_raw")
-def prune_data832_raw(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config)
-
-
-@flow(name="prune_data832_scratch")
-def prune_data832_scratch(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config)
-
-
-@flow(name="prune_alcf832_raw")
-def prune_alcf832_raw(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config)
-
-
-@flow(name="prune_alcf832_scratch")
-def prune_alcf832_scratch(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config)
-
+def create_prune_flow(location: str):
+    """
+    Build the prune flow for one location. Every location runs the same prune_files logic;
+    only the flow name, which deployments are registered under, differs.
 
-@flow(name="prune_nersc832_alsdev_scratch")
-def prune_nersc832_alsdev_scratch(
-        relative_path: str,
-        source_endpoint: GlobusEndpoint,
-        check_endpoint: Union[GlobusEndpoint, None] = None,
-        config=None,
-):
-    prune_files(
-        relative_path=relative_path,
-        source_endpoint=source_endpoint,
-        check_endpoint=check_endpoint,
-        config=config)
+    Args:
+        location (str): The server location, e.g. 'data832_raw'. The flow is named prune_{location}.
+    """
+    def prune_location(
+            relative_path: str,
+            source_endpoint: GlobusEndpoint,
+            check_endpoint: Union[GlobusEndpoint, None] = None,
+            config=None,
+    ):
+        prune_files(
+            relative_path=relative_path,
+            source_endpoint=source_endpoint,
+            check_endpoint=check_endpoint,
+            config=config)
+
+    # Name the function after its module attribute before wrapping it, since Prefect derives
+    # default deployment entrypoints (file.py:<fn name>) from it
+    prune_location.__name__ = prune_location.__qualname__ = f"prune_{location}"
+    return flow(name=f"prune_{location}")(prune_location)
+
+
+prune_spot832 = create_prune_flow("spot832")
+prune_data832 = create_prune_flow("data832")
+prune_data832_raw = create_prune_flow("data832_raw")
+prune_data832_scratch = create_prune_flow("data832_scratch")
+prune_alcf832_raw = create_prune_flow("alcf832_raw")
+prune_alcf832_scratch = create_prune_flow("alcf832_scratch")
+prune_nersc832_alsdev_scratch = create_prune_flow("nersc832_alsdev_scratch")
 
 
 if __name__ == "__main__":
@@ -1,12 +1,36 @@
 import importlib
 import os
+import time
 from typing import List
 
-from pyscicat.client import from_credentials
+from pyscicat.client import from_credentials, ScicatCommError
 from prefect import flow, task, get_run_logger
 
 from orchestration.flows.scicat.utils import Issue
 
+# Login tokens are only reused for this long before logging in again
+SCICAT_CLIENT_TTL_SECONDS = 1800
+_scicat_clients = {}
+
+
+def get_scicat_client(api_url: str, username: str, password: str, ttl=SCICAT_CLIENT_TTL_SECONDS):
+    """ Return a logged-in SciCat client, reusing a recent one for the same user
+    instead of logging in again for every ingest.
+    """
+    key = (api_url, username)
+    cached = _scicat_clients.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    scicat_client = from_credentials(api_url, username, password)
+    _scicat_clients[key] = (time.monotonic(), scicat_client)
+    return scicat_client
+
+
+def drop_scicat_client(api_url: str, username: str):
+    """ Forget the cached client so the next get_scicat_client call logs in again. """
+    _scicat_clients.pop((api_url, username), None)
+
+
 @flow(name="scicat_dataset_ingest")
 def ingest_dataset(file_path: str, ingestor: str):
     """ Ingest a file into SciCat.
@@ -21,6 +45,20 @@ def ingest_dataset(file_path: str, ingestor: str):
     ingest_dataset_task(file_path, ingestor)
 
 
+@flow(name="scicat_datasets_ingest")
+def ingest_datasets(file_paths: List[str], ingestor: str):
+    """ Ingest several files into SciCat in one flow run, sharing a single login.
+
+    Parameters
+    ----------
+    file_paths : List[str]
+        Paths where the files can be found on whatever server is processing this task
+    ingestor : str
+        The python module that contains the ingest function, e.g. "foo.bar.ingestor"
+    """
+    return [ingest_dataset_task(file_path, ingestor) for file_path in file_paths]
+
+
 @task(name="ingest_scicat")
 def ingest_dataset_task(file_path: str, ingestor_module: str):
     """ Ingest a file into SciCat. 
@@ -50,17 +88,23 @@ def ingest_dataset_task(file_path: str, ingestor_module: str):
     logger.info(
         f"Sending ingest job to {SCICAT_API_URL} for file {file_path}"
     )
-    scicat_client = from_credentials(
+    scicat_client = get_scicat_client(
         SCICAT_API_URL,
         SCICAT_INGEST_USER,
         SCICAT_INGEST_PASSWORD)
     ingestor_module = importlib.import_module(ingestor_module)
     issues: List[Issue] = []
-    new_dataset_id = ingestor_module.ingest(
-        scicat_client,
-        file_path,
-        issues,
-    )
+    try:
+        new_dataset_id = ingestor_module.ingest(
+            scicat_client,
+            file_path,
+            issues,
+        )
+    except ScicatCommError:
+        # pyscicat doesn't expose the status code, and a rejected or revoked token
+        # surfaces as this error, so log in again on the next ingest
+        drop_scicat_client(SCICAT_API_URL, SCICAT_INGEST_USER)
+        raise
     if len(issues) > 0:
         logger.error(f"SciCat ingest failed with {len(issues)} issues")
         for issue in issues:
@@ -16,6 +16,7 @@ from PIL import Image, ImageOps
 
 logger = logging.getLogger("splash_ingest")
 can_debug = logger.isEnabledFor(logging.DEBUG)
+search_term_separators = re.compile("[^a-zA-Z0-9]")
 
 class Severity(str, Enum):
     warning = "warning"
@@ -65,7 +66,7 @@ def calculate_access_controls(username, beamline, proposal) -> Dict:
 
 def build_search_terms(sample_name):
     """extract search terms from sample name to provide something pleasing to search on"""
-    terms = re.split("[^a-zA-Z0-9]", sample_name)
+    terms = search_term_separators.split(sample_name)
     description = [term.lower() for term in terms if len(term) > 0]
     return " ".join(description)
 
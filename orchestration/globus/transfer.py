@@ -109,10 +109,12 @@ def start_transfer(
         sync_level="checksum",
     )
     if source_path.is_dir():
-        # Add directory contents recursively
-        for item in source_path.rglob('*'):
-            relative_path = item.relative_to(source_path.parent)
-            tdata.add_item(str(item), os.path.join(dest_path, str(relative_path)))
+        # Let Globus walk the directory instead of enumerating every path here
+        tdata.add_item(
+            str(source_path),
+            os.path.join(dest_path, source_path.name),
+            recursive=True,
+        )
     else:
         tdata.add_item(str(source_path), dest_path)
     logger.info(
@@ -142,7 +144,7 @@ def get_files_recursive(
     files: List,
     older_than_days=14,
 ):
-    print(f"{endpoint.uri} {path}")
+    logger.debug("%s %s", endpoint.uri, path)
     contents = tc.operation_ls(endpoint.uuid, endpoint.full_path(path))
     for obj in contents:
         if obj["type"] == "file":
@@ -190,21 +192,18 @@ def prune_files(
     start_time = time()
 
     ddata = DeleteData(transfer_client=transfer_client, endpoint=endpoint.uuid, recursive=True)
-    logger.info(f"deleting {len(files)} from endpoint: {endpoint.uri}")
+    logger.info("deleting %s from endpoint: %s", len(files), endpoint.uri)
     for file in files:
-        logger.info(f"deleting {file}")
-        print(file)
-        file_path = endpoint.full_path(file)
-        # print("{endpoint.root_path}/{file}")
-        ddata.add_item(file_path)
+        logger.info("deleting %s", file)
+        ddata.add_item(endpoint.full_path(file))
     delete_result = transfer_client.submit_delete(ddata)
     task_id = delete_result["task_id"]
     task_wait(
         transfer_client, task_id, max_wait_seconds=max_wait_seconds, logger=logger
     )
-    logger.info(f"delete_result {delete_result}")
+    logger.info("delete_result %s", delete_result)
     elapsed_time = time() - start_time
-    logger.info(f"prune_files task took {elapsed_time:.2f} seconds")
+    logger.info("prune_files task took %.2f seconds", elapsed_time)
     return task_id
 
 
@@ -233,13 +232,13 @@ def task_wait(
             )
 
         logger.info(
-            f"waiting for task with task_id {task_id} to complete {task['nice_status']}"
+            "waiting for task with task_id %s to complete %s", task_id, task["nice_status"]
         )
 
         if task["status"] == "SUCCEEDED":
             logger.info("COMPLETE")
         elif task["status"] == "FAILED":
-            logger.info(f"globus task failed {task_id}")
+            logger.info("globus task failed %s", task_id)
 
         if task["nice_status"] in ["FILE_NOT_FOUND"]:
             transfer_client.cancel_task(task_id)
@@ -291,13 +290,12 @@ def prune_one_safe(
     else:
         logger.info("Not checking dates, sent if_older_than_days==0")
 
-    delete_id = prune_files(
+    # prune_files already blocks until the delete task finishes
+    prune_files(
         tranfer_client,
         source_endpoint,
         [file],
         max_wait_seconds=max_wait_seconds,
         logger=logger,
     )
-
-    task_wait(tranfer_client, delete_id)
     logger.info(f"file deleted from: {source_endpoint.uri}")
@@ -1,5 +1,7 @@
+from functools import lru_cache
 import json
 import logging
+import os
 from pathlib import Path
 import time
 
@@ -7,9 +9,10 @@ from authlib.integrations.requests_client import OAuth2Session
 from authlib.oauth2.rfc7523 import PrivateKeyJWT
 from authlib.jose import JsonWebKey
 
-from sfapi_client import Client
+from sfapi_client import Client, SfApiError
 from sfapi_client._sync.client import SFAPI_BASE_URL, SFAPI_TOKEN_URL
 from sfapi_client.compute import Machine
+from sfapi_client.jobs import JobState, TERMINAL_STATES
 
 # Temporary patch till the sfapi_client is updated
 from sfapi_client.jobs import JobSacct
@@ -17,6 +20,19 @@ from sfapi_client.compute import Compute
 JobSacct.model_rebuild()
 
 
+# Credentials are cached per (path, mtime) so a rotated file is picked up on the next client
+@lru_cache(maxsize=8)
+def _load_client_id(path, mtime_ns):
+    with open(path, "r") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _load_private_key(path, mtime_ns):
+    with open(path, "r") as f:
+        return JsonWebKey.import_key(json.loads(f.read()))
+
+
 class NerscClient(Client):
     def __init__(
         self,
@@ -55,12 +71,14 @@ class NerscClient(Client):
         self.perlmutter = self.compute(Machine.perlmutter)
 
     def get_client_id(self):
-        with open(self.path_client_id, "r") as f:
-            self.client_id = f.read()
+        self.client_id = _load_client_id(
+            self.path_client_id, os.stat(self.path_client_id).st_mtime_ns
+        )
 
     def get_private_key(self):
-        with open(self.path_private_key, "r") as f:
-            self.pri_key = JsonWebKey.import_key(json.loads(f.read()))
+        self.pri_key = _load_private_key(
+            self.path_private_key, os.stat(self.path_private_key).st_mtime_ns
+        )
 
     def get_machine_status(self):
         return self.perlmutter.status
@@ -72,8 +90,10 @@ class NerscClient(Client):
         self.get_private_key()
         
     def init_directory_paths(self):
-        self.home_path = f"/global/homes/{self.user().name[0]}/{self.user().name}"
-        self.scratch_path = f"/pscratch/sd/{self.user().name[0]}/{self.user().name}"
+        # each self.user() is an SFAPI round trip, so only ask once
+        user_name = self.user().name
+        self.home_path = f"/global/homes/{user_name[0]}/{user_name}"
+        self.scratch_path = f"/pscratch/sd/{user_name[0]}/{user_name}"
 
     def request_job_status(self):
         self.job = self.perlmutter.job(jobid=self.jobid)
@@ -98,6 +118,7 @@ class NerscClient(Client):
         self.job = None
         self.jobid = None
         self.task_id = None
+        self.job_state = None
         self.has_ran = False
 
         self.job_script_string = job_script
@@ -107,3 +128,38 @@ class NerscClient(Client):
         #self.update_job_state()
         self.logger.info(f"Submitted job id: {self.jobid}")
 
+    def task_wait(self, initial_interval=1, max_interval=60, timeout=None, not_found_grace=300):
+        # Poll with exponential backoff so short jobs return promptly
+        # without hammering the SFAPI on long ones,
+        # and drop back to a short interval whenever the state changes (e.g. PENDING -> RUNNING)
+        start = time.time()
+        interval = initial_interval
+        last_state = None
+        not_found_since = None
+        while True:
+            try:
+                self.update_job_state()
+                not_found_since = None
+            except SfApiError as e:
+                # sacct has no record of a job for a short while after submission,
+                # but give up if it stays missing for longer than not_found_grace seconds
+                if not str(e.message).startswith("Job not found"):
+                    raise
+                if not_found_since is None:
+                    not_found_since = time.time()
+                elif time.time() - not_found_since > not_found_grace:
+                    raise
+                self.logger.info(f"Job {self.jobid} not visible in sacct yet")
+            if self.job_state in TERMINAL_STATES:
+                break
+            if self.job_state != last_state:
+                interval = initial_interval
+                last_state = self.job_state
+            if timeout is not None and time.time() - start > timeout:
+                raise TimeoutError(f"Job {self.jobid} still {self.job_state} after {timeout} seconds")
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+        self.logger.info(f"Job {self.jobid} finished with state {self.job_state}")
+        return self.job_state == JobState.COMPLETED
+
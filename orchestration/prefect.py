@@ -1,15 +1,32 @@
 import asyncio
 import datetime
 import logging
+import time
+from zoneinfo import ZoneInfo
 
 from prefect import get_run_logger, task
 from prefect import get_client
 
 from prefect.states import Scheduled
-import pytz
 
 logger = logging.getLogger("orchestration.prefect")
 
+schedule_timezone = ZoneInfo("America/Los_Angeles")  # Adjust the timezone as needed
+
+# deployment_name -> (expires_at, deployment); deployment ids rarely change, so skip repeat lookups
+_deployment_cache = {}
+DEPLOYMENT_CACHE_TTL_SECONDS = 300
+
+
+async def _read_deployment(client, deployment_name, ttl=DEPLOYMENT_CACHE_TTL_SECONDS):
+    cached = _deployment_cache.get(deployment_name)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    deployment = await client.read_deployment_by_name(deployment_name)
+    if deployment:
+        _deployment_cache[deployment_name] = (time.monotonic() + ttl, deployment)
+    return deployment
+
 
 async def schedule(
     deployment_name,
@@ -17,35 +34,102 @@ async def schedule(
     parameters,
     duration_from_now: datetime.timedelta,
     logger=logger,
+    client=None,
 ):
-    async with get_client() as client:
-        deployment = await client.read_deployment_by_name(deployment_name)
-        assert (
-            deployment
-        ), f"No deployment found in config for deployment_name {deployment_name}"
-        timezone = pytz.timezone("America/Los_Angeles")  # Adjust the timezone as needed
-        now = datetime.datetime.now(timezone)
-        date_time_tz = now + duration_from_now
+    # Callers scheduling several runs can pass an open client to share its connection pool
+    if client is None:
+        async with get_client() as client:
+            return await schedule(
+                deployment_name,
+                flow_run_name,
+                parameters,
+                duration_from_now,
+                logger=logger,
+                client=client,
+            )
+
+    deployment = await _read_deployment(client, deployment_name)
+    assert (
+        deployment
+    ), f"No deployment found in config for deployment_name {deployment_name}"
+    await _create_scheduled_flow_run(
+        client, deployment_name, deployment, flow_run_name, parameters, duration_from_now
+    )
+    return
+
+
+async def _create_scheduled_flow_run(
+    client,
+    deployment_name,
+    deployment,
+    flow_run_name,
+    parameters,
+    duration_from_now: datetime.timedelta,
+):
+    now = datetime.datetime.now(schedule_timezone)
+    date_time_tz = now + duration_from_now
+    try:
         await client.create_flow_run_from_deployment(
             deployment.id,
             state=Scheduled(scheduled_time=date_time_tz),
             parameters=parameters,
             name=flow_run_name,
         )
-    return
+    except Exception:
+        # The cached deployment may have been deleted or recreated; look it up again next time
+        _deployment_cache.pop(deployment_name, None)
+        raise
+
+
+async def schedule_many(schedules):
+    """
+    Schedule several flow runs concurrently over one client.
+
+    Each item in schedules is a (deployment_name, flow_run_name, parameters, duration_from_now)
+    tuple. Each distinct deployment is looked up once. Returns one entry per schedule:
+    None on success, or the exception that schedule raised.
+    """
+    schedules = list(schedules)
+    async with get_client() as client:
+        names = list(dict.fromkeys(s[0] for s in schedules))
+        lookups = await asyncio.gather(
+            *[_read_deployment(client, name) for name in names],
+            return_exceptions=True,
+        )
+        deployments = dict(zip(names, lookups))
 
+        async def _schedule_one(deployment_name, flow_run_name, parameters, duration_from_now):
+            deployment = deployments[deployment_name]
+            if isinstance(deployment, BaseException):
+                raise deployment
+            assert (
+                deployment
+            ), f"No deployment found in config for deployment_name {deployment_name}"
+            await _create_scheduled_flow_run(
+                client, deployment_name, deployment, flow_run_name, parameters, duration_from_now
+            )
 
+        return await asyncio.gather(
+            *[_schedule_one(*s) for s in schedules], return_exceptions=True
+        )
+
+
+# These tasks are async so Prefect awaits them on its own event loop, also when called
+# from sync flows, rather than each call spinning up a fresh loop with asyncio.run
 @task(name="Schedule Prefect Flow")
-def schedule_prefect_flow(
+async def schedule_prefect_flow(
     deployment_name, flow_run_name, parameters, duration_from_now: datetime.timedelta
 ):
     logger = get_run_logger()
-    asyncio.run(
-        schedule(deployment_name, flow_run_name, parameters, duration_from_now, logger)
-    )
+    await schedule(deployment_name, flow_run_name, parameters, duration_from_now, logger)
     return
 
 
+@task(name="Schedule Prefect Flows")
+async def schedule_prefect_flows(schedules):
+    return await schedule_many(schedules)
+
+
 if __name__ == "__main__":
     import dotenv
 
@@ -1,25 +1,29 @@
+from functools import lru_cache
+
 from dotenv import load_dotenv
 import typer
 from typing import Optional
 
 from globus_compute_sdk.sdk.login_manager import LoginManager
 from globus_compute_sdk import Client
-from prefect import task, flow, get_run_logger
+from prefect import flow, get_run_logger
 
 load_dotenv()
 
 app = typer.Typer()
 
 
-@task
-def get_login_manager(environment: Optional[str] = None) -> LoginManager:
+@lru_cache(maxsize=1)
+def get_compute_client(environment: Optional[str] = None) -> Client:
     """
-    Create and return a LoginManager instance for Globus Compute.
+    Log in once and return a Globus Compute client, reused by later status checks in this process.
 
     :param environment: Optional environment name for token storage.
-    :return: LoginManager instance
+    :return: Client instance
     """
-    return LoginManager(environment=environment)
+    login_manager = LoginManager(environment=environment)
+    login_manager.ensure_logged_in()
+    return Client(login_manager=login_manager)
 
 
 @flow(name="check-compute-status")
@@ -32,14 +36,8 @@ def check_globus_compute_status(endpoint_id: str) -> bool:
     """
     logger = get_run_logger()
     try:
-        # Initialize the LoginManager
-        login_manager = get_login_manager()
-
-        # Ensure the user is logged in
-        login_manager.ensure_logged_in()
-
-        # Initialize the Globus Compute client with the LoginManager
-        compute_client = Client(login_manager=login_manager)
+        # Initialize the Globus Compute client, logging in only on the first check
+        compute_client = get_compute_client()
 
         # Check endpoint status
         endpoint_status = compute_client.get_endpoint_status(endpoint_id)